@@ -357,7 +357,8 @@ class RightBoxBuilder(BoxBuilder):
 
         easy = []
         hard = []
-        for node in dag.reverse_ops().topological_op_nodes():
+        # walk the topological order backwards rather than building a reversed copy of the dag
+        for node in reversed(list(dag.topological_op_nodes())):
             if (
                 qubits.issuperset(node.qargs)
                 and node.is_standard_gate()
@@ -151,7 +151,7 @@ class PauliPastCliffordNode(EvaluationNode):
     def reads_from(self):
         return {
             self._register_name: (
-                set(s for tup in self._subsystem_idxs for s in tup),
+                set(self._subsystem_idxs.ravel().tolist()),
                 VirtualType.PAULI,
             )
         }
@@ -159,7 +159,7 @@ class PauliPastCliffordNode(EvaluationNode):
     def writes_to(self):
         return {
             self._register_name: (
-                set(s for tup in self._subsystem_idxs for s in tup),
+                set(self._subsystem_idxs.ravel().tolist()),
                 VirtualType.PAULI,
             )
         }
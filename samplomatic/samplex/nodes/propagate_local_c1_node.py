@@ -80,7 +80,7 @@ class PropagateLocalC1Node(EvaluationNode):
     def reads_from(self):
         return {
             self._register_name: (
-                set(s for tup in self._subsystem_idxs for s in tup),
+                set(self._subsystem_idxs.ravel().tolist()),
                 VirtualType.C1,
             )
         }
@@ -88,7 +88,7 @@ class PropagateLocalC1Node(EvaluationNode):
     def writes_to(self):
         return {
             self._register_name: (
-                set(s for tup in self._subsystem_idxs for s in tup),
+                set(self._subsystem_idxs.ravel().tolist()),
                 VirtualType.C1,
             )
         }
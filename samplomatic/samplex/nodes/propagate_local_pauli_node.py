@@ -90,7 +90,7 @@ class PropagateLocalPauliNode(EvaluationNode):
     def reads_from(self):
         return {
             self._register_name: (
-                set(s for tup in self._subsystem_idxs for s in tup),
+                set(self._subsystem_idxs.ravel().tolist()),
                 VirtualType.PAULI,
             )
         }
@@ -98,7 +98,7 @@ class PropagateLocalPauliNode(EvaluationNode):
     def writes_to(self):
         return {
             self._register_name: (
-                set(s for tup in self._subsystem_idxs for s in tup),
+                set(self._subsystem_idxs.ravel().tolist()),
                 VirtualType.PAULI,
             )
         }
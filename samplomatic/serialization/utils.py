@@ -18,6 +18,17 @@ import pybase64
 
 from samplomatic.exceptions import SerializationError
 
+_DTYPE_ENCODINGS: dict[np.dtype, tuple[str, str]] = {
+    np.dtype(np.complex128): ("c128", "<c16"),
+    np.dtype(np.int64): ("i64", "<i8"),
+    np.dtype(np.uint32): ("u32", "<u8"),
+    np.dtype(np.uint8): ("u8", "<u2"),
+}
+"""A map from supported array dtypes to their serialized name and their encoded dtype."""
+
+_DTYPE_DECODINGS: dict[str, str] = dict(_DTYPE_ENCODINGS.values())
+"""A map from serialized dtype names to their encoded dtype."""
+
 
 def array_to_json(array: np.ndarray) -> str:
     """Convert an array to a json format.
@@ -31,20 +42,14 @@ def array_to_json(array: np.ndarray) -> str:
     Raises:
         ValueError: If the type of the array is unsupported.
     """
-    if array.dtype == np.dtype(np.complex128):
-        dtype = "c128"
-        data = pybase64.b64encode_as_string(array.astype("<c16").tobytes())
-    elif array.dtype == np.dtype(np.int64):
-        dtype = "i64"
-        data = pybase64.b64encode_as_string(array.astype("<i8").tobytes())
-    elif array.dtype == np.dtype(np.uint32):
-        dtype = "u32"
-        data = pybase64.b64encode_as_string(array.astype("<u8").tobytes())
-    elif array.dtype == np.dtype(np.uint8):
-        dtype = "u8"
-        data = pybase64.b64encode_as_string(array.astype("<u2").tobytes())
-    else:
-        raise ValueError(f"Unexpected NumPy dtype {array.dtype}.")
+    try:
+        dtype, encoded_dtype = _DTYPE_ENCODINGS[array.dtype]
+    except KeyError as exc:
+        raise ValueError(f"Unexpected NumPy dtype {array.dtype}.") from exc
+
+    # ``ascontiguousarray`` only copies when the array is not already C-contiguous in the encoded
+    # dtype, and pybase64 reads directly from the array buffer, so the common case is zero-copy
+    data = pybase64.b64encode_as_string(np.ascontiguousarray(array, dtype=encoded_dtype))
 
     return orjson.dumps({"data": data, "shape": array.shape, "dtype": dtype}).decode("utf-8")
 
@@ -63,19 +68,11 @@ def array_from_json(data: str) -> np.ndarray:
     """
     data = orjson.loads(data)
     dtype = data["dtype"]
-    shape = tuple(data["shape"])
-    raw = pybase64.b64decode(data["data"])
-
-    if dtype == "c128":
-        return np.frombuffer(raw, dtype="<c16").reshape(shape)
-    elif dtype == "i64":
-        return np.frombuffer(raw, dtype="<i8").reshape(shape)
-    elif dtype == "u32":
-        return np.frombuffer(raw, dtype="<u8").reshape(shape)
-    elif dtype == "u8":
-        return np.frombuffer(raw, dtype="<u2").reshape(shape)
+    if (encoded_dtype := _DTYPE_DECODINGS.get(dtype)) is None:
+        raise SerializationError(f"Unexpected NumPy dtype {dtype}.")
 
-    raise SerializationError(f"Unexpected NumPy dtype {dtype}.")
+    raw = pybase64.b64decode(data["data"])
+    return np.frombuffer(raw, dtype=encoded_dtype).reshape(tuple(data["shape"]))
 
 
 def slice_to_json(slc: slice) -> str:
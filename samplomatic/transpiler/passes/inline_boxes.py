@@ -12,12 +12,13 @@
 
 """InlineBoxes"""
 
+from collections.abc import Iterator
+
 from qiskit.circuit import Clbit, Qubit
-from qiskit.converters import circuit_to_dag
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.transpiler.basepasses import TransformationPass
 
-from ...aliases import DAGOpNode
+from ...aliases import CircuitInstruction, DAGOpNode
 
 
 class InlineBoxes(TransformationPass):
@@ -30,39 +31,49 @@ class InlineBoxes(TransformationPass):
         inlined_dag = dag.copy_empty_like()
         for node in dag.op_nodes():
             if node.name == "box":
-                inlined_dag.compose(self._inline_box(node), list(node.qargs), list(node.cargs))
+                self._inline_box(node, inlined_dag)
             else:
                 inlined_dag.apply_operation_back(node.op, node.qargs, node.cargs)
         return inlined_dag
 
-    def _inline_box(self, node: DAGOpNode) -> DAGCircuit:
+    def _inline_box(self, node: DAGOpNode, dag: DAGCircuit):
         """Inline the content of a box with the rest of the circuit.
 
-        It is called recursively for boxes that contain boxes.
+        Boxes that contain boxes are flattened iteratively with an explicit stack of the bodies
+        being traversed, so arbitrarily deep nesting does not hit the recursion limit.
 
         .. note ::
             This function assumes, but does not check, that ``node`` contains a box.
 
         Args:
-            A node that contains a box.
-
-        Return:
-            A DAG circuit containing the operation in the box.
+            node: A node that contains a box.
+            dag: The DAG circuit to append the operations in the box to (modified in place).
         """
         body = node.op.body
         qubit_map: dict[Qubit, Qubit] = dict(zip(body.qubits, node.qargs))
         clbit_map: dict[Clbit, Clbit] = dict(zip(body.clbits, node.cargs))
 
-        content = DAGCircuit()
-        content.add_qubits(node.qargs)
-        content.add_clbits(node.cargs)
+        # each entry holds the remaining instructions of a body along with its bit maps
+        stack: list[tuple[Iterator[CircuitInstruction], dict, dict]] = [
+            (iter(body.data), qubit_map, clbit_map)
+        ]
 
-        for box_node in circuit_to_dag(body).topological_op_nodes():
-            qargs = [qubit_map[qubit] for qubit in box_node.qargs]
-            cargs = [clbit_map[clbit] for clbit in box_node.cargs]
-            if box_node.op.name == "box":
-                content.compose(self._inline_box(box_node), qargs, cargs)
+        while stack:
+            instrs, qubit_map, clbit_map = stack[-1]
+            for instr in instrs:
+                qargs = [qubit_map[qubit] for qubit in instr.qubits]
+                cargs = [clbit_map[clbit] for clbit in instr.clbits]
+                if instr.operation.name == "box":
+                    # suspend the traversal of this body and descend into the nested box
+                    inner_body = instr.operation.body
+                    stack.append(
+                        (
+                            iter(inner_body.data),
+                            dict(zip(inner_body.qubits, qargs)),
+                            dict(zip(inner_body.clbits, cargs)),
+                        )
+                    )
+                    break
+                dag.apply_operation_back(instr.operation, qargs, cargs)
             else:
-                content.apply_operation_back(box_node.op, qargs, cargs)
-
-        return content
+                stack.pop()
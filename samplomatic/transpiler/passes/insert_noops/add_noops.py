@@ -68,10 +68,8 @@ class AddNoops(TransformationPass):
                 new_qubits = qubits.union(content.qubits)
                 new_content = QuantumCircuit(list(new_qubits), list(node.cargs))
 
-                for op in content.data:
-                    # map the qubits of each operation to their indices within all of the qubits
-                    # contained in the new box
-                    new_content.append(op.operation, op.qubits, op.clbits)
+                # place the original instructions on their own qubits within the expanded box
+                new_content.compose(content, content.qubits, content.clbits, inplace=True)
 
                 box = BoxOp(new_content, annotations=node.op.annotations)
                 new_dag.apply_operation_back(box, new_qubits, node.cargs)
@@ -43,10 +43,8 @@ class AddNoopsActiveAccum(TransformationPass):
 
                 new_content = QuantumCircuit(list(accumulated_qubits), list(node.cargs))
 
-                for op in content.data:
-                    # map the qubits of each operation to their indices within all of the qubits
-                    # contained in the new box
-                    new_content.append(op.operation, op.qubits, op.clbits)
+                # place the original instructions on their own qubits within the expanded box
+                new_content.compose(content, content.qubits, content.clbits, inplace=True)
 
                 box = BoxOp(new_content, annotations=node.op.annotations)
                 modified_dag.apply_operation_back(box, accumulated_qubits, node.cargs)
@@ -92,7 +92,7 @@ def undress_right_dressed_box(box: BoxOp) -> BoxOp:
         else:
             # Otherwise, flush the cache, then append the node's operation
             for qarg in node.qargs:
-                for node_gate_1q in cached_gates_1q.pop(qarg, []):
+                for node_gate_1q in cached_gates_1q.pop(qarg, ()):
                     new_content.append(node_gate_1q.op, node_gate_1q.qargs)
             new_content.append(node.op, node.qargs, node.cargs)
 
@@ -47,7 +47,6 @@ class U2Register(GroupRegister):
                     "abcx,abxd->abcd",
                     self._array[subsystem_idxs],
                     other.virtual_gates,
-                    optimize=True,
                 )
             )
         except (ValueError, IndexError) as exc:
@@ -62,7 +61,6 @@ class U2Register(GroupRegister):
                 "abcx,abxd->abcd",
                 self._array[subsystem_idxs],
                 other.virtual_gates,
-                optimize=True,
             )
         except (ValueError, IndexError) as exc:
             raise VirtualGateError(
@@ -77,7 +75,6 @@ class U2Register(GroupRegister):
                     "abcx,abxd->abcd",
                     other.virtual_gates,
                     self._array[subsystem_idxs],
-                    optimize=True,
                 )
             )
         except (ValueError, IndexError) as exc:
@@ -94,7 +91,6 @@ class U2Register(GroupRegister):
                 "abcx,abxd->abcd",
                 other.virtual_gates,
                 self._array[subsystem_idxs],
-                optimize=True,
             )
         except (ValueError, IndexError) as exc:
             raise VirtualGateError(
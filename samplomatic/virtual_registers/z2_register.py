@@ -37,7 +37,7 @@ class Z2Register(GroupRegister):
 
     def __init__(self, virtual_gates):
         super().__init__(virtual_gates)
-        self._array %= 2
+        np.bitwise_and(self._array, 1, out=self._array)
 
     @classmethod
     def identity(cls, num_subsystems, num_samples):
@@ -61,9 +61,14 @@ class Z2Register(GroupRegister):
 
     def inplace_multiply(self, other, subsystem_idxs: list[SubsystemIndex] | slice = slice(None)):
         try:
-            self._array[subsystem_idxs, :] = np.bitwise_xor(
-                self._array[subsystem_idxs, :], other.virtual_gates
-            )
+            if isinstance(subsystem_idxs, slice):
+                # slicing produces a view, so we can write the product straight into our array
+                view = self._array[subsystem_idxs, :]
+                np.bitwise_xor(view, other.virtual_gates, out=view)
+            else:
+                self._array[subsystem_idxs, :] = np.bitwise_xor(
+                    self._array[subsystem_idxs, :], other.virtual_gates
+                )
         except (ValueError, IndexError) as exc:
             raise VirtualGateError(
                 f"Register {self} and {other} have incompatible shapes or types, "
@@ -75,4 +80,4 @@ class Z2Register(GroupRegister):
 
     def __setitem__(self, sl, value):
         super().__setitem__(sl, value)
-        self._array %= 2
+        np.bitwise_and(self._array, 1, out=self._array)
@@ -77,20 +77,14 @@ def sample_simulate_and_compare_counts(circuit: QuantumCircuit, save_plot):
         else:
             twirled_circuit_counts = twirled_creg_data.get_counts()
 
-        print(twirled_circuit_counts)
-        print(original_creg_data.get_counts())
+        original_circuit_counts = original_creg_data.get_counts()
         assert (
-            hellinger_fidelity(original_creg_data.get_counts(), twirled_circuit_counts)
+            hellinger_fidelity(original_circuit_counts, twirled_circuit_counts)
             > REQUIRED_HELLINGER_FIDELITY
-        )
+        ), f"Original counts {original_circuit_counts}, twirled counts {twirled_circuit_counts}."
 
 
 def _simulate(circuit: QuantumCircuit, circuit_params):
     """Run the Aer simulator and returns the result."""
     sampler = SamplerV2()
-    print(circuit_params.shape)
-    print(len(circuit.parameters))
-    for inst in circuit:
-        print(inst)
-        print(inst.params)
     return sampler.run([(circuit, circuit_params, 1000)]).result()[0]
@@ -16,8 +16,15 @@ import pytest
 
 from samplomatic.exceptions import SamplexBuildError, SamplexRuntimeError
 from samplomatic.samplex.nodes import PropagateLocalC1Node
+from samplomatic.tables.local_c1_tables import LOCAL_C1_PROPAGATE_LOOKUP_TABLES
 from samplomatic.virtual_registers import C1Register, VirtualType
 
+VALID_PAIRS = {
+    gate: np.argwhere(np.all(LOCAL_C1_PROPAGATE_LOOKUP_TABLES[gate] >= 0, axis=-1))
+    for gate in ["cx", "cz", "ecr"]
+}
+"""The ``(c0, c1)`` pairs that stay local under each gate, in row-major order."""
+
 
 def test_one_qubit_gate():
     """Test propagating C1 register past a one-qubit Clifford gate."""
@@ -34,74 +41,71 @@ def test_one_qubit_gate():
     assert node.outgoing_register_type is VirtualType.C1
 
 
-def test_cx_gate():
-    """Test propagating C1 register past a controlled-X gate."""
-    node = PropagateLocalC1Node("cx", "my_reg", [(0, 1)])
-    assert node.outgoing_register_type is VirtualType.C1
-
-    # Use Pauli subgroup inputs (C1 indices 0-3) which always remain local
-    # CX Pauli table: (0,0)→(0,0), (2,0)→(2,2), (1,3)→(0,3)
-    reg = C1Register(np.array([[0, 2, 1], [0, 0, 3]], dtype=np.uint8))
-    node.evaluate({"my_reg": reg}, np.empty(()))
-
-    assert reg.virtual_gates.tolist() == [[0, 2, 0], [0, 2, 3]]
-
-
-def test_cx_gate_non_pauli():
-    """Test propagating non-Pauli C1 elements past a controlled-X gate."""
-    node = PropagateLocalC1Node("cx", "my_reg", [(0, 1)])
-
-    # (22,13)→(23,15), (20,14)→(20,14)
-    reg = C1Register(np.array([[22, 20], [13, 14]], dtype=np.uint8))
-    node.evaluate({"my_reg": reg}, np.empty(()))
-
-    assert reg.virtual_gates.tolist() == [[23, 20], [15, 14]]
-
-
-def test_cz_gate():
-    """Test propagating C1 register past a controlled-Z gate."""
-    node = PropagateLocalC1Node("cz", "my_reg", [(0, 1)])
+@pytest.mark.parametrize(
+    "gate, virtual_gates, expected",
+    [
+        # Pauli subgroup inputs (C1 indices 0-3) always remain local
+        # CX Pauli table: (0,0)→(0,0), (2,0)→(2,2), (1,3)→(0,3)
+        ("cx", [[0, 2, 1], [0, 0, 3]], [[0, 2, 0], [0, 2, 3]]),
+        # (22,13)→(23,15), (20,14)→(20,14)
+        ("cx", [[22, 20], [13, 14]], [[23, 20], [15, 14]]),
+        # CZ Pauli table: (0,0)→(0,0), (2,3)→(3,2), (1,2)→(0,2)
+        ("cz", [[0, 2, 1], [0, 3, 2]], [[0, 3, 0], [0, 2, 2]]),
+        # (22,20)→(22,21), (20,22)→(21,22)
+        ("cz", [[22, 20], [20, 22]], [[22, 21], [21, 22]]),
+        # ECR Pauli table: (0,0)→(0,0), (2,3)→(2,3), (1,2)→(1,2)
+        ("ecr", [[0, 2, 1], [0, 3, 2]], [[0, 2, 1], [0, 3, 2]]),
+        # (20,12)→(21,12), (22,13)→(23,13)
+        ("ecr", [[20, 22], [12, 13]], [[21, 23], [12, 13]]),
+    ],
+)
+def test_two_qubit_gate(gate, virtual_gates, expected):
+    """Test propagating C1 register past a two-qubit Clifford gate."""
+    node = PropagateLocalC1Node(gate, "my_reg", [(0, 1)])
     assert node.outgoing_register_type is VirtualType.C1
 
-    # CZ Pauli table: (0,0)→(0,0), (2,3)→(3,2), (1,2)→(0,2)
-    reg = C1Register(np.array([[0, 2, 1], [0, 3, 2]], dtype=np.uint8))
+    reg = C1Register(np.array(virtual_gates, dtype=np.uint8))
     node.evaluate({"my_reg": reg}, np.empty(()))
 
-    assert reg.virtual_gates.tolist() == [[0, 3, 0], [0, 2, 2]]
+    assert reg.virtual_gates.tolist() == expected
 
 
-def test_cz_gate_non_pauli():
-    """Test propagating non-Pauli C1 elements past a controlled-Z gate."""
-    node = PropagateLocalC1Node("cz", "my_reg", [(0, 1)])
+@pytest.mark.parametrize("gate", ["cx", "cz", "ecr"])
+def test_large_batch(rng, gate):
+    """Test propagating a large batch of local pairs past a two-qubit gate."""
+    table = LOCAL_C1_PROPAGATE_LOOKUP_TABLES[gate]
+    valid_pairs = VALID_PAIRS[gate]
+    node = PropagateLocalC1Node(gate, "my_reg", [(0, 1), (2, 3)])
 
-    # (22,20)→(22,21), (20,22)→(21,22)
-    reg = C1Register(np.array([[22, 20], [20, 22]], dtype=np.uint8))
+    virtual_gates = np.concatenate(
+        [valid_pairs[rng.integers(0, len(valid_pairs), 50_000)].T for _ in range(2)]
+    ).astype(np.uint8)
+    reg = C1Register(virtual_gates.copy())
     node.evaluate({"my_reg": reg}, np.empty(()))
 
-    assert reg.virtual_gates.tolist() == [[22, 21], [21, 22]]
-
+    assert reg.virtual_gates.shape == (4, 50_000)
+    assert reg.virtual_gates.dtype == np.uint8
 
-def test_ecr_gate():
-    """Test propagating C1 register past an ECR gate."""
-    node = PropagateLocalC1Node("ecr", "my_reg", [(0, 1)])
-    assert node.outgoing_register_type is VirtualType.C1
+    expected = table[virtual_gates[0::2], virtual_gates[1::2]]
+    assert np.array_equal(reg.virtual_gates[0::2], expected[..., 0])
+    assert np.array_equal(reg.virtual_gates[1::2], expected[..., 1])
 
-    # ECR Pauli table: (0,0)→(0,0), (2,3)→(2,3), (1,2)→(1,2)
-    reg = C1Register(np.array([[0, 2, 1], [0, 3, 2]], dtype=np.uint8))
-    node.evaluate({"my_reg": reg}, np.empty(()))
 
-    assert reg.virtual_gates.tolist() == [[0, 2, 1], [0, 3, 2]]
+def test_evaluate_is_in_place(rng):
+    """Test that evaluation writes into the register's existing buffer."""
+    node = PropagateLocalC1Node("cx", "my_reg", [(0, 1), (2, 3), (4, 5)])
+    # Pauli subgroup inputs (C1 indices 0-3) always remain local
+    reg = C1Register(rng.integers(0, 4, (6, 10_000), dtype=np.uint8))
+    virtual_gates = reg.virtual_gates
+    address = virtual_gates.ctypes.data
+    strides = virtual_gates.strides
 
-
-def test_ecr_gate_non_pauli():
-    """Test propagating non-Pauli C1 elements past an ECR gate."""
-    node = PropagateLocalC1Node("ecr", "my_reg", [(0, 1)])
-
-    # (20,12)→(21,12), (22,13)→(23,13)
-    reg = C1Register(np.array([[20, 22], [12, 13]], dtype=np.uint8))
     node.evaluate({"my_reg": reg}, np.empty(()))
 
-    assert reg.virtual_gates.tolist() == [[21, 23], [12, 13]]
+    assert reg.virtual_gates is virtual_gates
+    assert reg.virtual_gates.ctypes.data == address
+    assert reg.virtual_gates.strides == strides
+    assert reg.virtual_gates.flags.c_contiguous
 
 
 def test_invalid_input_errors():
@@ -114,6 +118,21 @@ def test_invalid_input_errors():
         node.evaluate({"my_reg": reg}, np.empty(()))
 
 
+def test_invalid_input_errors_large_batch(rng):
+    """Test that a single non-local shot in a large batch raises without touching the register."""
+    node = PropagateLocalC1Node("cx", "my_reg", [(0, 1), (2, 3)])
+    # Pauli subgroup inputs (C1 indices 0-3) always remain local
+    virtual_gates = rng.integers(0, 4, (4, 10_000), dtype=np.uint8)
+    # c0=4 (H), c1=0 (I) does not stay local under CX conjugation
+    virtual_gates[2:, 7_777] = [4, 0]
+    reg = C1Register(virtual_gates.copy())
+
+    with pytest.raises(SamplexRuntimeError, match="did not remain local"):
+        node.evaluate({"my_reg": reg}, np.empty(()))
+
+    assert np.array_equal(reg.virtual_gates, virtual_gates)
+
+
 def test_init_error():
     """Test init error."""
     with pytest.raises(SamplexBuildError, match=", found hadamard."):
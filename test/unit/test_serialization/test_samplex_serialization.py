@@ -13,6 +13,7 @@
 
 import re
 
+import orjson
 import pytest
 from qiskit.circuit import Parameter, ParameterVector, QuantumCircuit
 
@@ -25,6 +26,37 @@ from samplomatic.ssv import SSV
 SUPPORTED_SSVS = set(range(1, SSV + 1))
 
 
+@pytest.fixture(scope="module")
+def general_5q_samplex():
+    """Return the samplex of a general static circuit of 5 qubits, built once per module."""
+    circuit = QuantumCircuit(5)
+    with circuit.box([Twirl()]):
+        circuit.rz(0.5, 0)
+        circuit.sx(0)
+        circuit.rz(0.5, 0)
+        circuit.cx(0, 3)
+        circuit.noop(range(5))
+
+    circuit.cx(0, 1)
+
+    with circuit.box([Twirl(decomposition="rzrx")]):
+        circuit.rz(0.123, 2)
+        circuit.cx(3, 4)
+        circuit.cx(3, 2)
+        circuit.noop(1)
+
+    with circuit.box([Twirl()]):
+        circuit.cx(0, 1)
+
+    with circuit.box([Twirl(dressing="right")]):
+        circuit.noop(range(5))
+
+    circuit.measure_all()
+
+    _, samplex = build(circuit)
+    return samplex
+
+
 class TestSamplexSerialization:
     """Test serialization of samplex functions."""
 
@@ -42,40 +74,16 @@ class TestSamplexSerialization:
             samplex_to_json(samplex, ssv=9999)
 
     @pytest.mark.parametrize("ssv", SUPPORTED_SSVS)
-    def test_general_5q_static_circuit(self, ssv):
+    def test_general_5q_static_circuit(self, general_5q_samplex, ssv):
         """Test with a general static circuit of 5 qubits."""
-        circuit = QuantumCircuit(5)
-        with circuit.box([Twirl()]):
-            circuit.rz(0.5, 0)
-            circuit.sx(0)
-            circuit.rz(0.5, 0)
-            circuit.cx(0, 3)
-            circuit.noop(range(5))
-
-        circuit.cx(0, 1)
-
-        with circuit.box([Twirl(decomposition="rzrx")]):
-            circuit.rz(0.123, 2)
-            circuit.cx(3, 4)
-            circuit.cx(3, 2)
-            circuit.noop(1)
-
-        with circuit.box([Twirl()]):
-            circuit.cx(0, 1)
-
-        with circuit.box([Twirl(dressing="right")]):
-            circuit.noop(range(5))
-
-        circuit.measure_all()
-
-        _, samplex = build(circuit)
-        json_data = samplex_to_json(samplex, ssv=ssv)
+        json_data = samplex_to_json(general_5q_samplex, ssv=ssv)
         assert isinstance(json_data, str)
+        assert isinstance(orjson.loads(json_data), dict)
 
         samplex_new = samplex_from_json(json_data)
         samplex_new.finalize()
 
-        assert samplex == samplex_new
+        assert general_5q_samplex == samplex_new
 
     @pytest.mark.parametrize("ssv", SUPPORTED_SSVS)
     def test_noise_injection_circuit(self, ssv):
@@ -11,8 +11,7 @@
 # that they have been altered from the originals.
 
 
-from itertools import product
-
+import numpy as np
 import pytest
 from qiskit.circuit.library import CXGate, CZGate, ECRGate, HGate
 from qiskit.quantum_info import Clifford
@@ -21,18 +20,23 @@ from samplomatic.tables.c1_tables import C1_TO_TABLEAU
 from samplomatic.tables.local_c1_tables import LOCAL_C1_PROPAGATE_LOOKUP_TABLES
 
 
+@pytest.fixture(scope="module")
+def c1_cliffords():
+    """Return the single-qubit Cliffords, in the order of ``C1_TO_TABLEAU``."""
+    return tuple(Clifford(tableau, False) for tableau in C1_TO_TABLEAU)
+
+
 @pytest.mark.parametrize("op_class", [HGate])
-def test_1q_gate_tables(op_class):
+def test_1q_gate_tables(op_class, c1_cliffords):
     """Test the lookup tables for one-qubit gates."""
     op = op_class()
     gate_cliff = Clifford(op)
     gate_inv = gate_cliff.adjoint()
     table = LOCAL_C1_PROPAGATE_LOOKUP_TABLES[op.name]
 
-    for c1_idx in range(24):
-        c1_cliff = Clifford(C1_TO_TABLEAU[c1_idx], False)
+    for c1_idx, c1_cliff in enumerate(c1_cliffords):
         result = gate_inv.dot(c1_cliff).dot(gate_cliff)
-        expected = Clifford(C1_TO_TABLEAU[table[c1_idx, 0]], False)
+        expected = c1_cliffords[table[c1_idx, 0]]
 
         assert result == expected, (
             f"C1[{c1_idx}] through {op.name}: Table says C1[{table[c1_idx, 0]}], "
@@ -41,41 +45,36 @@ def test_1q_gate_tables(op_class):
 
 
 @pytest.mark.parametrize("op_class", [CXGate, CZGate, ECRGate])
-def test_2q_gate_tables(op_class):
+def test_2q_gate_tables(op_class, c1_cliffords):
     """Test the lookup tables for two-qubit gates."""
     op = op_class()
-    gate_cliff = Clifford(op)
-    gate_inv = gate_cliff.adjoint()
+    gate = Clifford(op).to_matrix()
     table = LOCAL_C1_PROPAGATE_LOOKUP_TABLES[op.name]
+    c1_unitaries = np.array([c1_cliff.to_matrix() for c1_cliff in c1_cliffords])
+
+    # conjugate all 576 pairs by the gate at once, where the pair at index [c0, c1] is the unitary
+    # of C1[c1] ⊗ C1[c0] (i.e. with C1[c0] acting on qubit 0)
+    pairs = np.einsum("bij,akl->abikjl", c1_unitaries, c1_unitaries).reshape(24, 24, 4, 4)
+    results = gate.conj().T @ pairs @ gate
 
-    for c0, c1 in product(range(24), repeat=2):
-        cliff0 = Clifford(C1_TO_TABLEAU[c0], False)
-        cliff1 = Clifford(C1_TO_TABLEAU[c1], False)
-        cliff_2q = cliff1.tensor(cliff0)
-        result = gate_inv.dot(cliff_2q).dot(gate_cliff)
+    # a two-qubit unitary factorizes into C1 ⊗ C1 iff its operator-Schmidt rank is one, i.e., iff
+    # its realignment has a single non-zero singular value
+    realigned = (
+        results.reshape(24, 24, 2, 2, 2, 2).transpose(0, 1, 2, 4, 3, 5).reshape(24, 24, 4, 4)
+    )
+    is_local = np.linalg.svd(realigned, compute_uv=False)[..., 1] < 1e-8
+    wrong_locality = np.argwhere(is_local != (table[..., 0] >= 0)).tolist()
+    assert not wrong_locality, (
+        f"Pairs {wrong_locality} through {op.name}: Table has wrong locality."
+    )
 
-        if table[c0, c1, 0] == -1:
-            # Verify result does not factorize into C1 ⊗ C1
-            tab = result.tableau
-            has_cross = (
-                tab[0, 1]
-                or tab[0, 3]
-                or tab[1, 0]
-                or tab[1, 2]
-                or tab[2, 1]
-                or tab[2, 3]
-                or tab[3, 0]
-                or tab[3, 2]
-            )
-            assert (
-                has_cross
-            ), f"({c0}, {c1}) through {op.name}: Table says non-local, but result appears local."
-        else:
-            expected_0 = Clifford(C1_TO_TABLEAU[table[c0, c1, 0]], False)
-            expected_1 = Clifford(C1_TO_TABLEAU[table[c0, c1, 1]], False)
-            expected_2q = expected_1.tensor(expected_0)
-            assert result == expected_2q, (
-                f"({c0}, {c1}) through {op.name}: Table says "
-                f"({table[c0, c1, 0]}, {table[c0, c1, 1]}), "
-                f"but Qiskit gives a different result."
-            )
+    # the local results must match the table up to a global phase
+    c0, c1 = np.nonzero(is_local)
+    expected = np.einsum(
+        "nij,nkl->nikjl", c1_unitaries[table[c0, c1, 1]], c1_unitaries[table[c0, c1, 0]]
+    ).reshape(-1, 4, 4)
+    overlaps = np.abs(np.einsum("nij,nij->n", results[c0, c1].conj(), expected))
+    wrong_pairs = np.stack([c0, c1], axis=1)[~np.isclose(overlaps, 4)].tolist()
+    assert not wrong_pairs, (
+        f"Pairs {wrong_pairs} through {op.name}: Table disagrees with the Qiskit result."
+    )
@@ -12,6 +12,7 @@
 
 """Tests for `undress_box`"""
 
+import pytest
 from qiskit.circuit import BoxOp, ClassicalRegister, Parameter, QuantumCircuit, QuantumRegister
 
 from samplomatic.annotations import Twirl
@@ -30,29 +31,30 @@ def test_empty_box():
     assert undress_box(box) == box
 
 
-def test_undressed_box():
-    """Test `undress_box` for a box without dressing."""
+@pytest.fixture
+def body_and_params():
+    """Return a box body with single-qubit gates on both sides of a CX, and its parameters."""
     body = QuantumCircuit(QuantumRegister(3, "my_qreg"), ClassicalRegister(2, "my_creg"))
     body.h(0)
-    body.rz(Parameter("theta"), 0)
+    body.rz(theta := Parameter("theta"), 0)
     body.z(1)
     body.cx(0, 1)
-    body.rz(Parameter("phi"), 1)
+    body.rz(phi := Parameter("phi"), 1)
     body.y(2)
+    return body, theta, phi
+
+
+def test_undressed_box(body_and_params):
+    """Test `undress_box` for a box without dressing."""
+    body, _, _ = body_and_params
     box = BoxOp(body)
 
     assert undress_box(box) == box
 
 
-def test_left_dressed_box():
+def test_left_dressed_box(body_and_params):
     """Test `undress_box` for a left-dressed box."""
-    body = QuantumCircuit(QuantumRegister(3, "my_qreg"), ClassicalRegister(2, "my_creg"))
-    body.h(0)
-    body.rz(Parameter("theta"), 0)
-    body.z(1)
-    body.cx(0, 1)
-    body.rz(ph := Parameter("phi"), 1)
-    body.y(2)
+    body, _, ph = body_and_params
     box = BoxOp(body, annotations=[Twirl(dressing="left")])
 
     body_expected = QuantumCircuit(body.qubits + body.clbits)
@@ -63,15 +65,9 @@ def test_left_dressed_box():
     assert undress_box(box) == box_expected
 
 
-def test_right_dressed_box():
-    """Test `undress_box` for a left-dressed box."""
-    body = QuantumCircuit(QuantumRegister(3, "my_qreg"), ClassicalRegister(2, "my_creg"))
-    body.h(0)
-    body.rz(th := Parameter("theta"), 0)
-    body.z(1)
-    body.cx(0, 1)
-    body.rz(Parameter("phi"), 1)
-    body.y(2)
+def test_right_dressed_box(body_and_params):
+    """Test `undress_box` for a right-dressed box."""
+    body, th, _ = body_and_params
     box = BoxOp(body, annotations=[Twirl(dressing="right")])
 
     body_expected = QuantumCircuit(body.qubits + body.clbits)
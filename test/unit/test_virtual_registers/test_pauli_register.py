@@ -133,6 +133,19 @@ def test_inplace_multiply_with_subinds():
     assert rhs == PauliRegister([[1, 1, 1]])
 
 
+def test_inplace_multiply_with_slice():
+    """Test the inplace_multiply() method with a slice of subsystems."""
+    lhs = PauliRegister([[0, 1, 2], [2, 2, 1], [3, 0, 1]])
+    rhs = PauliRegister([[1, 1, 1], [2, 3, 1]])
+
+    lhs.inplace_multiply(rhs, subsystem_idxs=slice(1, None))
+    assert lhs == PauliRegister([[0, 1, 2], [3, 3, 0], [1, 3, 0]])
+    assert rhs == PauliRegister([[1, 1, 1], [2, 3, 1]])
+
+    with pytest.raises(VirtualGateError, match="incompatible shapes"):
+        lhs.inplace_multiply(rhs, subsystem_idxs=slice(0, 1))
+
+
 def test_left_multiply():
     """Test the left_multiply() method."""
     rhs = PauliRegister([[0, 1, 2], [2, 2, 1]])
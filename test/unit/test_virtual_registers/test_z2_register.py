@@ -82,6 +82,16 @@ def test_inplace_multiply_with_subinds():
     assert rhs == Z2Register([[1, 1, 1]])
 
 
+def test_inplace_multiply_with_slice():
+    """Test the inplace_multiply() method with a slice of subsystems."""
+    lhs = Z2Register([[0, 1, 0], [0, 0, 1], [1, 1, 1]])
+    rhs = Z2Register([[1, 1, 1], [0, 1, 0]])
+
+    lhs.inplace_multiply(rhs, subsystem_idxs=slice(1, None))
+    assert lhs == Z2Register([[0, 1, 0], [1, 1, 0], [1, 0, 1]])
+    assert rhs == Z2Register([[1, 1, 1], [0, 1, 0]])
+
+
 def test_left_multiply():
     """Test the left_multiply() method."""
     rhs = Z2Register([[0, 1, 1], [0, 0, 1]])